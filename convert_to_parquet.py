@@ -0,0 +1,40 @@
+import pandas as pd
+
+CSV_PATH = 'datasets/data_full.csv'
+PARQUET_PATH = 'datasets/data_full.parquet'
+
+
+def convert() -> None:
+    """
+    Function converts preprocessed data from CSV to Parquet with downcast dtypes pre-baked,
+    so the app loads a compact typed columnar file instead of re-parsing text.
+    """
+
+    dtypes = {
+        'AGE': 'int8',
+        'GENDER': 'int8',
+        'CHILD_TOTAL': 'int8',
+        'DEPENDANTS': 'int8',
+        'SOCSTATUS_WORK_FL': 'int8',
+        'SOCSTATUS_PENS_FL': 'int8',
+        'FL_PRESENCE_FL': 'int8',
+        'OWN_AUTO': 'int8',
+        'EDUCATION': 'category',
+        'MARITAL_STATUS': 'category',
+        'GEN_INDUSTRY': 'category',
+        'GEN_TITLE': 'category',
+        'FAMILY_INCOME': 'category',
+        'WORK_TIME': 'float32',
+        'PERSONAL_INCOME': 'float32',
+        'CREDIT': 'float32',
+        'FST_PAYMENT': 'float32',
+    }
+
+    data = pd.read_csv(CSV_PATH, dtype=dtypes)
+    # these features are serialized as floats in the CSV, so they are downcast after parsing
+    data = data.astype({'TARGET': 'int8', 'TERM': 'int8', 'LOAN_NUM_TOTAL': 'int8', 'LOAN_NUM_CLOSED': 'int8'})
+    data.to_parquet(PARQUET_PATH, index=False)
+
+
+if __name__ == '__main__':
+    convert()
@@ -0,0 +1,58 @@
+import numpy as np
+import pandas as pd
+import phik  # noqa: F401 - registers the .phik_matrix accessor
+
+DATA_PATH = 'datasets/data_full.parquet'
+PHIK_PATH = 'datasets/phik_long.parquet'
+
+
+def precompute() -> None:
+    """
+    Function precomputes phik correlation matrix over the full dataset and stores it in long format,
+    so the app reads a small parquet file on startup instead of running the computation.
+    """
+
+    data_types = {'TARGET': 'categorical',
+                  'AGE': 'interval',
+                  'GENDER': 'categorical',
+                  'EDUCATION': 'categorical',
+                  'MARITAL_STATUS': 'categorical',
+                  'CHILD_TOTAL': 'ordinal',
+                  'DEPENDANTS': 'ordinal',
+                  'SOCSTATUS_WORK_FL': 'categorical',
+                  'SOCSTATUS_PENS_FL': 'categorical',
+                  'FL_PRESENCE_FL': 'categorical',
+                  'OWN_AUTO': 'ordinal',
+                  'WORK_TIME': 'interval',
+                  'FAMILY_INCOME': 'ordinal',
+                  'PERSONAL_INCOME': 'interval',
+                  'LOAN_NUM_TOTAL': 'ordinal',
+                  'LOAN_NUM_CLOSED': 'ordinal',
+                  'CREDIT': 'interval',
+                  'TERM': 'interval',
+                  'FST_PAYMENT': 'interval'
+                  }
+
+    data = pd.read_parquet(DATA_PATH, columns=list(data_types.keys()))
+    # pre-bin interval columns once and use integer codes for the rest, so phik does not
+    # re-bin each interval column for every pair it participates in
+    binned = pd.DataFrame({
+        col: (pd.cut(data[col], 20, labels=False).astype('int8') if v == 'interval'
+              else data[col].astype('category').cat.codes.astype('int16'))
+        for col, v in data_types.items()
+    })
+    corr_matrix = binned.phik_matrix(interval_cols=[], njobs=-1)
+    # the matrix is symmetric, so only the upper triangle is stored; the app mirrors it back
+    corr_matrix = (corr_matrix
+                   .where(np.triu(np.ones(corr_matrix.shape, dtype=bool)))
+                   .stack()
+                   .dropna()
+                   .reset_index()
+                   .rename(columns={0: 'correlation', 'level_0': 'variable', 'level_1': 'variable2'}))
+    # shrink the payload the app ships to the browser: float32 values, dictionary-encoded axis labels
+    corr_matrix = corr_matrix.astype({'variable': 'category', 'variable2': 'category', 'correlation': 'float32'})
+    corr_matrix.to_parquet(PHIK_PATH, index=False)
+
+
+if __name__ == '__main__':
+    precompute()
@@ -1,14 +1,27 @@
 import streamlit as st
+import numpy as np
 import pandas as pd
 import altair as alt
-import phik
 
-DATA_PATH = 'datasets/data_full.csv'
+DATA_PATH = 'datasets/data_full.parquet'
+PHIK_PATH = 'datasets/phik_long.parquet'
 RANDOM_STATE = 42
 
+# columns the app actually reads, to benefit from parquet projection pushdown
+USED_COLS = ['TARGET', 'AGE', 'GENDER', 'EDUCATION', 'MARITAL_STATUS', 'CHILD_TOTAL', 'DEPENDANTS',
+             'SOCSTATUS_WORK_FL', 'SOCSTATUS_PENS_FL', 'FL_PRESENCE_FL', 'OWN_AUTO', 'GEN_INDUSTRY', 'GEN_TITLE',
+             'WORK_TIME', 'FAMILY_INCOME', 'PERSONAL_INCOME', 'LOAN_NUM_TOTAL', 'LOAN_NUM_CLOSED', 'CREDIT', 'TERM',
+             'FST_PAYMENT']
+
+# bins per continuous feature, previously alt.Bin maxbins left to Vega
+INTERVAL_BINS = {'AGE': 10, 'PERSONAL_INCOME': 30, 'WORK_TIME': 20, 'CREDIT': 20, 'TERM': 20, 'FST_PAYMENT': 20}
+
 # configure default settings of the page
 st.set_page_config(layout="wide", page_title="Bank Promo Response", page_icon=":bank:")
 
+# evaluate Altair transforms (aggregation, binning) server-side so only final rows reach the browser
+alt.data_transformers.enable("vegafusion")
+
 # initialize variables to filter data based on TARGET values (separately for each EDA tab except correlation)
 if 'TARGET_DEMO' not in st.session_state:
     st.session_state['TARGET_DEMO'] = False
@@ -19,67 +32,139 @@ if 'TARGET_CREDIT' not in st.session_state:
 
 
 @st.cache_data
-def load_data(data_path: str) -> pd.DataFrame:
+def load_data() -> tuple:
     """
-    Function loads data with cache.
+    Function loads data with cache. Downcast dtypes are pre-baked in the parquet file (see convert_to_parquet.py)
+    and only the columns the app reads are loaded. Rows are sorted by TARGET so per-target views are
+    contiguous slices (see filter_data) and the split index is returned alongside the data.
 
-    :param data_path: data path
-    :return:
+    :return: data and the index of the first TARGET=1 row
     """
 
-    data = pd.read_csv(DATA_PATH)
+    data = pd.read_parquet(DATA_PATH, columns=USED_COLS)
+    data = data.sort_values('TARGET', kind='stable', ignore_index=True)
+    split = int((data['TARGET'] == 0).sum())
 
-    return data
+    return data, split
 
 
-@st.cache_data
-def filter_data(df: pd.DataFrame, target_selected: int) -> pd.DataFrame:
+def filter_data(df: pd.DataFrame, target_selected: int, split: int) -> pd.DataFrame:
     """
-    Function filters data based on TARGET feature value with cache.
+    Function slices rows with the given TARGET feature value. The data is sorted by TARGET at load,
+    so the slice is a contiguous view with sequential memory access instead of a mask gather.
 
     :param df: initial data
     :param target_selected: TARGET feature value
+    :param split: index of the first TARGET=1 row
     :return: filtered data
     """
 
-    return df[df["TARGET"] == target_selected]
+    return df.iloc[:split] if target_selected == 0 else df.iloc[split:]
+
+
+def bincount_table(series: pd.Series) -> pd.DataFrame:
+    """
+    Function counts values of a small non-negative integer feature with np.bincount, which fills
+    a fixed-size array in one scan instead of building a hash table like value_counts.
+
+    :param series: int8/int16 feature values
+    :return: per-value counts and shares, most frequent first (matching value_counts)
+    """
+
+    counts = np.bincount(series.to_numpy())
+    table = pd.DataFrame({series.name: np.arange(counts.size, dtype=series.dtype), 'count': counts})
+    table = table[table['count'] > 0].sort_values('count', ascending=False, ignore_index=True)
+    table['percent'] = table['count'] / table['count'].sum()
+
+    return table
+
+
+def hist_source(series: pd.Series, bins: int) -> pd.DataFrame:
+    """
+    Function bins a continuous feature in pandas and returns per-bin counts, so charts receive
+    at most `bins` rows instead of one row per unique value plus a Vega binning pass.
+
+    :param series: feature values to bin
+    :param bins: number of equal-width bins
+    :return: per-bin counts with string bin labels
+    """
+
+    table = pd.cut(series, bins=bins).value_counts().sort_index().reset_index()
+    table[series.name] = table[series.name].astype(str)
+    table['percent'] = table['count'] / table['count'].sum()
+
+    return table
 
 
 @st.cache_data
-def phik_data(df: pd.DataFrame) -> pd.DataFrame:
+def precompute_counts(df: pd.DataFrame, target_selected: int, split: int) -> dict:
     """
-    Function computes and returns phik correlation matrix in long format with cache
-    :param df: data
+    Function computes value counts for all visualized features in a single pass over the data with cache.
+
+    :param df: initial data
+    :param target_selected: TARGET feature value
+    :param split: index of the first TARGET=1 row
+    :return: dict mapping feature name to its value counts
+    """
+
+    sub = filter_data(df, target_selected, split)
+    cols = ['GENDER', 'AGE', 'EDUCATION', 'MARITAL_STATUS', 'CHILD_TOTAL', 'DEPENDANTS', 'SOCSTATUS_WORK_FL',
+            'SOCSTATUS_PENS_FL', 'FL_PRESENCE_FL', 'OWN_AUTO', 'PERSONAL_INCOME', 'FAMILY_INCOME', 'WORK_TIME',
+            'CREDIT', 'TERM', 'FST_PAYMENT', 'LOAN_NUM_TOTAL', 'LOAN_NUM_CLOSED']
+
+    counts = {}
+    for col in cols:
+        # read only the single column each table needs - a contiguous slice, no row gather
+        values = sub[col]
+        if col == 'WORK_TIME':
+            # filter out data re not working clients before binning
+            counts[col] = hist_source(values[values > 0], INTERVAL_BINS[col])
+        elif col in INTERVAL_BINS:
+            counts[col] = hist_source(values, INTERVAL_BINS[col])
+        elif pd.api.types.is_integer_dtype(values):
+            # flags and small counts are bounded int8, so counting reduces to a bincount
+            counts[col] = bincount_table(values)
+        else:
+            vc = values.value_counts()
+            # value_counts on categorical dtypes reports absent categories as zero counts - drop them
+            table = vc[vc > 0].reset_index()
+            table['percent'] = table['count'] / table['count'].sum()
+            counts[col] = table
+
+    return counts
+
+
+@st.cache_data
+def top_n(df: pd.DataFrame, col: str, n: int = 10) -> set:
+    """
+    Function computes the n most frequent values of a feature over the full dataset with cache,
+    so both TARGET views share one set instead of re-sorting the filtered frame on every toggle.
+
+    :param df: initial data
+    :param col: feature name
+    :param n: number of top values to keep
+    :return: set of the top feature values
+    """
+
+    return set(df.loc[df[col] != 'not_applicable', col].value_counts().head(n).index)
+
+
+@st.cache_data
+def phik_data() -> pd.DataFrame:
+    """
+    Function loads precomputed phik correlation matrix in long format with cache (see precompute_phik.py).
+
     :return: correlation matrix
     """
-    data_types = {'TARGET': 'categorical',
-                  'AGE': 'interval',
-                  'GENDER': 'categorical',
-                  'EDUCATION': 'categorical',
-                  'MARITAL_STATUS': 'categorical',
-                  'CHILD_TOTAL': 'ordinal',
-                  'DEPENDANTS': 'ordinal',
-                  'SOCSTATUS_WORK_FL': 'categorical',
-                  'SOCSTATUS_PENS_FL': 'categorical',
-                  'FL_PRESENCE_FL': 'categorical',
-                  'OWN_AUTO': 'ordinal',
-                  'WORK_TIME': 'interval',
-                  'FAMILY_INCOME': 'ordinal',
-                  'PERSONAL_INCOME': 'interval',
-                  'LOAN_NUM_TOTAL': 'ordinal',
-                  'LOAN_NUM_CLOSED': 'ordinal',
-                  'CREDIT': 'interval',
-                  'TERM': 'interval',
-                  'FST_PAYMENT': 'interval'
-                  }
-
-    interval_cols = [col for col, v in data_types.items() if v == 'interval']
-    corr_matrix = (df[list(data_types.keys())]
-                   .phik_matrix(interval_cols=interval_cols, bins=20)
-                   .stack()
-                   .reset_index()
-                   .rename(columns={0: 'correlation', 'level_0': 'variable', 'level_1': 'variable2'}))
-    corr_matrix['correlation_label'] = corr_matrix['correlation'].map('{:.1f}'.format)
+
+    corr_matrix = pd.read_parquet(PHIK_PATH)
+    # the parquet stores only the upper triangle of the symmetric matrix - mirror it for the full heatmap
+    mirrored = corr_matrix.rename(columns={'variable': 'variable2', 'variable2': 'variable'})
+    corr_matrix = (pd.concat([corr_matrix, mirrored], ignore_index=True)
+                   .drop_duplicates(['variable', 'variable2']))
+    # label only significant cells, so the browser renders far fewer text glyphs
+    values = corr_matrix['correlation'].to_numpy()
+    corr_matrix['correlation_label'] = np.where(np.abs(values) >= 0.1, np.char.mod('%.1f', values), '')
 
     return corr_matrix
 
@@ -93,36 +178,56 @@ def from_callback(suffix: str) -> None:
     st.session_state[f"TARGET_{suffix}"] = not st.session_state[f"TARGET_{suffix}"]
 
 
-def bar_chart(source: pd.DataFrame, feature: str, color: str, bin: alt.Bin = None,
-              x_title: str = None, y_title: str = None) -> None:
+@st.cache_data
+def bar_chart_spec(source: pd.DataFrame, feature: str, color: str, sort: str = 'ascending',
+                   x_title: str = None, y_title: str = None) -> dict:
     """
-    Function draws and displays bar chart.
+    Function builds bar chart Vega-Lite spec with cache, so reruns skip Altair construction
+    and serialization entirely.
 
     :param source: data to display
     :param feature: feature to visualize
     :param color: bars color
-    :param bin: binarize data params
+    :param sort: x values order (None keeps the source row order, e.g. for pre-binned features)
     :param x_title: x label title to display
     :param y_title: y label title to display
+    :return: Vega-Lite spec with inlined data
     """
-    chart = alt.Chart(source).transform_joinaggregate(
-        total='sum(count)',
-    ).transform_calculate(
-        percent="datum.count / datum.total"
-    ).mark_bar(color=color).encode(
-        alt.X(feature, bin=bin, axis=alt.Axis(labelAngle=0, title=x_title)),
+    chart = alt.Chart(source).mark_bar(color=color).encode(
+        alt.X(feature, sort=sort, axis=alt.Axis(labelAngle=0, title=x_title)),
         alt.Y('sum(percent):Q', axis=alt.Axis(format='.0%', title=y_title))
     ).properties(height=250)
 
-    st.altair_chart(chart, use_container_width=True)
+    # sources are pre-aggregated tables, so there is nothing for vegafusion to evaluate - inline the rows
+    with alt.data_transformers.enable('default'):
+        return chart.to_dict()
 
 
-def pie_chart(source: pd.DataFrame, feature: str) -> None:
+def bar_chart(source: pd.DataFrame, feature: str, color: str, sort: str = 'ascending',
+              x_title: str = None, y_title: str = None) -> None:
+    """
+    Function draws and displays bar chart from a cached spec.
+
+    :param source: data to display
+    :param feature: feature to visualize
+    :param color: bars color
+    :param sort: x values order (None keeps the source row order, e.g. for pre-binned features)
+    :param x_title: x label title to display
+    :param y_title: y label title to display
+    """
+
+    st.vega_lite_chart(bar_chart_spec(source, feature, color, sort, x_title, y_title), use_container_width=True)
+
+
+@st.cache_data
+def pie_chart_spec(source: pd.DataFrame, feature: str) -> dict:
     """
-    Function draws and displays pie chart.
+    Function builds pie chart Vega-Lite spec with cache, so reruns skip Altair construction
+    and serialization entirely.
 
     :param source: data to display
     :param feature: feature to visualize
+    :return: Vega-Lite spec with inlined data
     """
 
     chart = alt.Chart(source).mark_arc(innerRadius=50).encode(
@@ -131,11 +236,55 @@ def pie_chart(source: pd.DataFrame, feature: str) -> None:
         color=alt.Color(f"{feature}:N")
     ).properties(height=250).configure_legend(title=None)
 
-    st.altair_chart(chart, use_container_width=True)
+    # sources are pre-aggregated tables, so there is nothing for vegafusion to evaluate - inline the rows
+    with alt.data_transformers.enable('default'):
+        return chart.to_dict()
+
+
+def pie_chart(source: pd.DataFrame, feature: str) -> None:
+    """
+    Function draws and displays pie chart from a cached spec.
+
+    :param source: data to display
+    :param feature: feature to visualize
+    """
+
+    st.vega_lite_chart(pie_chart_spec(source, feature), use_container_width=True)
+
+
+@st.cache_resource
+def heatmap_spec() -> dict:
+    """
+    Function builds correlation heatmap Vega-Lite spec once per worker. The underlying matrix never
+    changes, so the rect + text composite is cached as a singleton with no dataframe hashing at all.
+
+    :return: Vega-Lite spec with inlined data
+    """
+
+    source = phik_data()
+    plot = alt.Chart(source).mark_rect(strokeOpacity=0).encode(
+        x=alt.X('variable:O', axis=alt.Axis(grid=False, title=None, labelLimit=360)),
+        y=alt.Y('variable2:O', axis=alt.Axis(grid=False, title=None, labelLimit=360)),
+        color=alt.Color('correlation:Q', scale=alt.Scale(scheme='brownbluegreen'))
+    ).properties(
+        height=760
+    )
+    text = plot.mark_text(fontSize=16).encode(
+        text='correlation_label',
+        color=alt.condition(
+            ((alt.datum.correlation > 0.75) | (alt.datum.correlation < 0.25)),
+            alt.value('white'),
+            alt.value('black')
+        )
+    )
+
+    # the matrix is a small pre-aggregated table, so there is nothing for vegafusion to evaluate
+    with alt.data_transformers.enable('default'):
+        return (plot + text).to_dict()
 
 
 # load data
-data = load_data(DATA_PATH)
+data, split = load_data()
 
 # title and intro text columns
 row1_1, row1_2 = st.columns([1, 2])
@@ -167,6 +316,9 @@ tab1, tab2, tab3, tab4 = st.tabs([
 
 # demographics, education, family and social status tab
 with tab1:
+    # precompute value counts once per tab so every chart reuses the same cached tables
+    counts_demo = precompute_counts(data, int(st.session_state.TARGET_DEMO), split)
+
     row1_1, row1_2 = st.columns([1, 2])
 
     with row1_1:
@@ -192,22 +344,19 @@ with tab1:
 
     with row2_1:
         st.subheader('Пол')
-        source = filter_data(data, st.session_state.TARGET_DEMO).GENDER.value_counts().reset_index().replace({
-            1: 'Мужчины',
-            0: 'Женщины'
-        })
+        source = counts_demo['GENDER']
+        source['GENDER'] = source['GENDER'].map({1: 'Мужчины', 0: 'Женщины'})
 
         bar_chart(source, 'GENDER:N', color='#83c9ff', y_title='percent')
 
     with row2_2:
         st.subheader('Возраст')
-        source = filter_data(data, st.session_state.TARGET_DEMO).AGE.value_counts().reset_index()
-        bar_chart(source, 'AGE:Q', color='#83c9ff', bin=alt.Bin(maxbins=10))
+        source = counts_demo['AGE']
+        bar_chart(source, 'AGE:N', color='#83c9ff', sort=None)
 
     with row2_3:
         st.subheader('Образование')
-        source = filter_data(data, st.session_state.TARGET_DEMO).EDUCATION.value_counts().reset_index(
-        ).rename(columns={'count': 'percent'})
+        source = counts_demo['EDUCATION']
         pie_chart(source, 'EDUCATION')
 
     # family and social status columns
@@ -215,36 +364,37 @@ with tab1:
 
     with row3_1:
         st.subheader('Семейное положение')
-        source = filter_data(data, st.session_state.TARGET_DEMO).MARITAL_STATUS.value_counts().reset_index(
-        ).rename(columns={'count': 'percent'})
+        source = counts_demo['MARITAL_STATUS']
         pie_chart(source, 'MARITAL_STATUS')
 
     with row3_2:
         st.subheader('Дети')
-        source = filter_data(data, st.session_state.TARGET_DEMO).CHILD_TOTAL.value_counts().reset_index()
+        source = counts_demo['CHILD_TOTAL']
         bar_chart(source, 'CHILD_TOTAL:N', color='#83c9ff', y_title='percent')
 
     with row3_3:
         st.subheader('Иждивенцы')
-        source = filter_data(data, st.session_state.TARGET_DEMO).DEPENDANTS.value_counts().reset_index()
+        source = counts_demo['DEPENDANTS']
         bar_chart(source, 'DEPENDANTS:N', color='#83c9ff')
 
     with row3_4:
         st.subheader('Работа')
-        source = (filter_data(data, st.session_state.TARGET_DEMO).SOCSTATUS_WORK_FL.value_counts()
-                  .reset_index()
-                  .replace({1: 'да', 0: 'нет'}))
+        source = counts_demo['SOCSTATUS_WORK_FL']
+        source['SOCSTATUS_WORK_FL'] = source['SOCSTATUS_WORK_FL'].map({1: 'да', 0: 'нет'})
         bar_chart(source, 'SOCSTATUS_WORK_FL:N', color='#83c9ff')
 
     with row3_5:
         st.subheader('Пенсионер')
-        source = (filter_data(data, st.session_state.TARGET_DEMO).SOCSTATUS_PENS_FL.value_counts()
-                  .reset_index()
-                  .replace({1: 'да', 0: 'нет'}))
+        source = counts_demo['SOCSTATUS_PENS_FL']
+        source['SOCSTATUS_PENS_FL'] = source['SOCSTATUS_PENS_FL'].map({1: 'да', 0: 'нет'})
         bar_chart(source, 'SOCSTATUS_PENS_FL:N', color='#83c9ff')
 
 # assets, income and job tab
 with tab2:
+    # slice data and precompute value counts once per tab so every chart reuses them
+    df_money = filter_data(data, int(st.session_state.TARGET_MONEY), split)
+    counts_money = precompute_counts(data, int(st.session_state.TARGET_MONEY), split)
+
     row1_1, row1_2 = st.columns([1, 2])
 
     with row1_1:
@@ -272,26 +422,23 @@ with tab2:
 
     with row2_1:
         st.subheader('Квартира')
-        source = filter_data(data, st.session_state.TARGET_MONEY).FL_PRESENCE_FL.value_counts().reset_index().replace({
-            1: 'да',
-            0: 'нет'
-        })
+        source = counts_money['FL_PRESENCE_FL']
+        source['FL_PRESENCE_FL'] = source['FL_PRESENCE_FL'].map({1: 'да', 0: 'нет'})
         bar_chart(source, 'FL_PRESENCE_FL:N', color='#fb9a99', y_title='percent')
 
     with row2_2:
         st.subheader('Машины')
-        source = filter_data(data, st.session_state.TARGET_MONEY).OWN_AUTO.value_counts().reset_index()
+        source = counts_money['OWN_AUTO']
         bar_chart(source, 'OWN_AUTO:N', color='#fb9a99')
 
     with row2_3:
         st.subheader('Персональный доход')
-        source = filter_data(data, st.session_state.TARGET_MONEY).PERSONAL_INCOME.value_counts().reset_index()
-        bar_chart(source, 'PERSONAL_INCOME:Q', color='#fb9a99', bin=alt.Bin(maxbins=30), x_title='рубли')
+        source = counts_money['PERSONAL_INCOME']
+        bar_chart(source, 'PERSONAL_INCOME:N', color='#fb9a99', sort=None, x_title='рубли')
 
     with row2_4:
         st.subheader('Семейный доход')
-        source = filter_data(data, st.session_state.TARGET_MONEY).FAMILY_INCOME.value_counts().reset_index(
-        ).rename(columns={'count': 'percent'})
+        source = counts_money['FAMILY_INCOME']
         pie_chart(source, 'FAMILY_INCOME')
 
     # job columns
@@ -299,37 +446,40 @@ with tab2:
 
     with row3_1:
         st.subheader('Топ-10 отраслей')
-        source = filter_data(data, st.session_state.TARGET_MONEY)
         # filter out data re not working clients
-        source = source[source.GEN_INDUSTRY != 'not_applicable']
-        # aggregate industries not in top10 in a single value 'other industries'
-        top10_industries = source.GEN_INDUSTRY.value_counts()[:10].index.tolist()
-        source['GEN_INDUSTRY'] = source.GEN_INDUSTRY.apply(lambda x: x if x in top10_industries else 'Другие сферы')
-        source = source.GEN_INDUSTRY.value_counts().reset_index().rename(columns={'count': 'percent'})
+        industry = df_money['GEN_INDUSTRY']
+        industry = industry[industry != 'not_applicable']
+        # aggregate industries not in the dataset-wide top10 in a single value 'other industries'
+        top10_industries = top_n(data, 'GEN_INDUSTRY')
+        industry = industry.where(industry.isin(top10_industries), 'Другие сферы').cat.remove_unused_categories()
+        source = industry.value_counts().reset_index()
+        source['percent'] = source['count'] / source['count'].sum()
 
         pie_chart(source, 'GEN_INDUSTRY')
 
     with row3_2:
         st.subheader('Топ-10 должностей')
-        source = filter_data(data, st.session_state.TARGET_MONEY)
         # filter out data re not working clients
-        source = source[source.GEN_TITLE != 'not_applicable']
-        # aggregate job titles not in top10 in a single value 'other'
-        top10_job_titles = source.GEN_TITLE.value_counts()[:10].index.tolist()
-        source['GEN_INDUSTRY'] = source.GEN_TITLE.apply(lambda x: x if x in top10_job_titles else 'Другое')
-        source = source.GEN_TITLE.value_counts().reset_index().rename(columns={'count': 'percent'})
+        title = df_money['GEN_TITLE']
+        title = title[title != 'not_applicable']
+        # aggregate job titles not in the dataset-wide top10 in a single value 'other'
+        top10_job_titles = top_n(data, 'GEN_TITLE')
+        title = title.where(title.isin(top10_job_titles), 'Другое').cat.remove_unused_categories()
+        source = title.value_counts().reset_index()
+        source['percent'] = source['count'] / source['count'].sum()
         pie_chart(source, 'GEN_TITLE')
 
     with row3_3:
         st.subheader('На текущей работе')
-        source = filter_data(data, st.session_state.TARGET_MONEY).WORK_TIME.value_counts().reset_index()
-        # filter out data re not working clients
-        source = source[source.WORK_TIME > 0]
-        bar_chart(source, 'WORK_TIME:Q', color='#fb9a99', bin=alt.Bin(maxbins=20), x_title='месяцы',
+        source = counts_money['WORK_TIME']
+        bar_chart(source, 'WORK_TIME:N', color='#fb9a99', sort=None, x_title='месяцы',
                   y_title='percent')
 
 # credit history tab
 with tab3:
+    # precompute value counts once per tab so every chart reuses the same cached tables
+    counts_credit = precompute_counts(data, int(st.session_state.TARGET_CREDIT), split)
+
     row1_1, row1_2 = st.columns((1, 2))
 
     with row1_1:
@@ -355,31 +505,31 @@ with tab3:
 
     with row3_1:
         st.subheader('сумма')
-        source = filter_data(data, st.session_state.TARGET_CREDIT).CREDIT.value_counts().reset_index()
-        bar_chart(source, 'CREDIT:Q', color='#fdbf6f', bin=alt.Bin(maxbins=20),
+        source = counts_credit['CREDIT']
+        bar_chart(source, 'CREDIT:N', color='#fdbf6f', sort=None,
                   x_title='рубли', y_title='percent')
 
     with row3_2:
         st.subheader('срок')
-        source = filter_data(data, st.session_state.TARGET_CREDIT).TERM.value_counts().reset_index()
-        bar_chart(source, 'TERM:Q', color='#fdbf6f', bin=alt.Bin(maxbins=20), x_title='месяцы')
+        source = counts_credit['TERM']
+        bar_chart(source, 'TERM:N', color='#fdbf6f', sort=None, x_title='месяцы')
 
     with row3_3:
         st.subheader('первоначальный взнос')
-        source = filter_data(data, st.session_state.TARGET_CREDIT).FST_PAYMENT.value_counts().reset_index()
-        bar_chart(source, 'FST_PAYMENT:Q', color='#fdbf6f', bin=alt.Bin(maxbins=20), x_title='рубли')
+        source = counts_credit['FST_PAYMENT']
+        bar_chart(source, 'FST_PAYMENT:N', color='#fdbf6f', sort=None, x_title='рубли')
 
     # aggregated credits data columns
     row2_1, row2_2, _ = st.columns([1, 1, 1])
 
     with row2_1:
         st.subheader('Полученные кредиты')
-        source = filter_data(data, st.session_state.TARGET_CREDIT).LOAN_NUM_TOTAL.value_counts().reset_index()
+        source = counts_credit['LOAN_NUM_TOTAL']
         bar_chart(source, 'LOAN_NUM_TOTAL:N', color='#fdbf6f', y_title='percent')
 
     with row2_2:
         st.subheader('Погашенные кредиты')
-        source = filter_data(data, st.session_state.TARGET_CREDIT).LOAN_NUM_CLOSED.value_counts().reset_index()
+        source = counts_credit['LOAN_NUM_CLOSED']
         bar_chart(source, 'LOAN_NUM_CLOSED:N', color='#fdbf6f')
 
 # correlation tab
@@ -415,22 +565,6 @@ with tab4:
         )
 
     with row1_2:
-        source = phik_data(data)
         # correlation heatmap
-        plot = alt.Chart(source).mark_rect(strokeOpacity=0).encode(
-            x=alt.X('variable:O', axis=alt.Axis(grid=False, title=None, labelLimit=360)),
-            y=alt.Y('variable2:O', axis=alt.Axis(grid=False, title=None, labelLimit=360)),
-            color=alt.Color('correlation:Q', scale=alt.Scale(scheme='brownbluegreen'))
-        ).properties(
-            height=760
-        )
-        text = plot.mark_text(fontSize=16).encode(
-            text='correlation_label',
-            color=alt.condition(
-                ((alt.datum.correlation > 0.75) | (alt.datum.correlation < 0.25)),
-                alt.value('white'),
-                alt.value('black')
-            )
-        )
-        st.altair_chart(plot + text, use_container_width=True)
+        st.vega_lite_chart(heatmap_spec(), use_container_width=True)
 